@@ -185,8 +185,7 @@ def stage_sources(staging_dir: Path, version: str, package: str) -> None:
     else:
         raise RuntimeError(f"Unknown package '{package}'.")
 
-    with open(package_json_path, "r", encoding="utf-8") as fh:
-        package_json = json.load(fh)
+    package_json = json.loads(package_json_path.read_text(encoding="utf-8"))
     package_json["version"] = version
 
     if package == "codex-sdk":
@@ -201,9 +200,9 @@ def stage_sources(staging_dir: Path, version: str, package: str) -> None:
         else:
             package_json["files"] = ["dist", "vendor"]
 
-    with open(staging_dir / "package.json", "w", encoding="utf-8") as out:
-        json.dump(package_json, out, indent=2)
-        out.write("\n")
+    (staging_dir / "package.json").write_text(
+        json.dumps(package_json, indent=2) + "\n", encoding="utf-8"
+    )
 
 
 def run_command(cmd: list[str], cwd: Path | None = None) -> None:
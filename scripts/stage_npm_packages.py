@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
 import importlib.util
 import json
 import os
@@ -18,13 +19,22 @@ BUILD_SCRIPT = REPO_ROOT / "codex-cli" / "scripts" / "build_npm_package.py"
 INSTALL_NATIVE_DEPS = REPO_ROOT / "codex-cli" / "scripts" / "install_native_deps.py"
 WORKFLOW_NAME = ".github/workflows/rust-release.yml"
 GITHUB_REPO = "openai/codex"
+NATIVE_CACHE_MAX_ENTRIES = 3
 
-_SPEC = importlib.util.spec_from_file_location("codex_build_npm_package", BUILD_SCRIPT)
-if _SPEC is None or _SPEC.loader is None:
-    raise RuntimeError(f"Unable to load module from {BUILD_SCRIPT}")
-_BUILD_MODULE = importlib.util.module_from_spec(_SPEC)
-_SPEC.loader.exec_module(_BUILD_MODULE)
+
+def _load_module(name: str, path: Path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    if spec is None or spec.loader is None:
+        raise RuntimeError(f"Unable to load module from {path}")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+_BUILD_MODULE = _load_module("codex_build_npm_package", BUILD_SCRIPT)
 PACKAGE_NATIVE_COMPONENTS = getattr(_BUILD_MODULE, "PACKAGE_NATIVE_COMPONENTS", {})
+_INSTALL_MODULE = _load_module("codex_install_native_deps", INSTALL_NATIVE_DEPS)
+RG_MANIFEST: Path = _INSTALL_MODULE.RG_MANIFEST
 
 
 def parse_args() -> argparse.Namespace:
@@ -51,6 +61,14 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Directory where npm tarballs should be written (default: dist/npm).",
     )
+    parser.add_argument(
+        "--native-cache",
+        action="store_true",
+        help=(
+            "Reuse native artifacts previously downloaded for the same workflow URL from "
+            "$XDG_CACHE_HOME/codex-npm-native (default: always download)."
+        ),
+    )
     parser.add_argument(
         "--keep-staging-dirs",
         action="store_true",
@@ -98,20 +116,93 @@ def resolve_workflow_url(version: str, override: str | None) -> tuple[str, str |
     return workflow["url"], workflow.get("headSha")
 
 
+def native_cache_root() -> Path:
+    cache_home = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    return cache_home / "codex-npm-native"
+
+
+def native_cache_dir(workflow_url: str, components: set[str]) -> Path:
+    key = hashlib.sha256()
+    key.update(workflow_url.encode("utf-8"))
+    for component in sorted(components):
+        key.update(b"\0" + component.encode("utf-8"))
+    if "rg" in components and RG_MANIFEST.exists():
+        # ripgrep comes from the DotSlash manifest rather than the workflow run.
+        key.update(b"\0" + RG_MANIFEST.read_bytes())
+    return native_cache_root() / key.hexdigest()
+
+
+def populate_native_cache(vendor_dir: Path, cache_dir: Path) -> None:
+    """Best-effort copy of a freshly installed vendor tree into the cache."""
+
+    partial_dir: Path | None = None
+    try:
+        cache_dir.parent.mkdir(parents=True, exist_ok=True)
+        # Copy into a unique sibling first so an interrupted or concurrent run never
+        # leaves a partially populated entry behind.
+        partial_dir = Path(tempfile.mkdtemp(prefix=".partial-", dir=cache_dir.parent))
+        shutil.copytree(vendor_dir, partial_dir, dirs_exist_ok=True)
+        shutil.rmtree(cache_dir, ignore_errors=True)
+        partial_dir.rename(cache_dir)
+        partial_dir = None
+    except OSError as exc:
+        print(f"warning: unable to cache native components in {cache_dir}: {exc}")
+    finally:
+        if partial_dir is not None:
+            shutil.rmtree(partial_dir, ignore_errors=True)
+
+    prune_native_cache(cache_dir.parent, keep=NATIVE_CACHE_MAX_ENTRIES)
+
+
+def prune_native_cache(cache_root: Path, keep: int) -> None:
+    """Remove all but the `keep` most recently used cache entries."""
+
+    try:
+        entries = [
+            entry
+            for entry in cache_root.iterdir()
+            if entry.is_dir() and not entry.name.startswith(".")
+        ]
+        entries.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+    except OSError as exc:
+        print(f"warning: unable to prune native cache {cache_root}: {exc}")
+        return
+
+    for entry in entries[keep:]:
+        shutil.rmtree(entry, ignore_errors=True)
+
+
 def install_native_components(
     workflow_url: str,
     components: set[str],
     vendor_root: Path,
+    *,
+    use_cache: bool = False,
 ) -> None:
     if not components:
         return
 
+    vendor_dir = vendor_root / "vendor"
+    cache_dir = native_cache_dir(workflow_url, components) if use_cache else None
+    if cache_dir is not None and cache_dir.is_dir():
+        print(f"Reusing cached native components from {cache_dir}")
+        shutil.copytree(cache_dir, vendor_dir, dirs_exist_ok=True)
+        # Mark the entry as recently used so pruning keeps it.
+        try:
+            os.utime(cache_dir)
+        except OSError:
+            pass
+        return
+
     cmd = [str(INSTALL_NATIVE_DEPS), "--workflow-url", workflow_url]
     for component in sorted(components):
         cmd.extend(["--component", component])
     cmd.append(str(vendor_root))
     run_command(cmd)
 
+    if cache_dir is not None:
+        populate_native_cache(vendor_dir, cache_dir)
+
 
 def run_command(cmd: list[str]) -> None:
     print("+", " ".join(cmd))
@@ -141,7 +232,12 @@ def main() -> int:
                 args.release_version, args.workflow_url
             )
             vendor_temp_root = Path(tempfile.mkdtemp(prefix="npm-native-", dir=runner_temp))
-            install_native_components(workflow_url, native_components, vendor_temp_root)
+            install_native_components(
+                workflow_url,
+                native_components,
+                vendor_temp_root,
+                use_cache=args.native_cache,
+            )
             vendor_src = vendor_temp_root / "vendor"
 
         if resolved_head_sha: